@@ -4,31 +4,49 @@ NrMAP GitHub Push Script
 Pushes the NrMAP project to GitHub using credentials from .env file
 """
 
+import asyncio
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
-
-def run_command(cmd, check=True, capture_output=False):
-    """Run a shell command"""
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=check,
-            capture_output=capture_output,
-            text=True
-        )
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {cmd}")
-        print(f"Error: {e.stderr if capture_output else e}")
-        if check:
-            sys.exit(1)
-        return None
-
-def main():
+
+# Resolved once so each call execs git directly
+GIT = shutil.which("git") or "git"
+
+def load_env_file(path):
+    """Parse KEY=VALUE lines from a .env file"""
+    env = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            env[key.strip()] = value.strip().strip("\"'")
+    return env
+
+async def run_git(args, check=True, capture_output=False):
+    """Run a git command asynchronously (argv list without "git", no shell)"""
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    # close_fds=False lets CPython use posix_spawn instead of fork+exec
+    process = await asyncio.create_subprocess_exec(
+        GIT, *args, stdout=pipe, stderr=pipe, close_fds=False
+    )
+    stdout, stderr = await process.communicate()
+    result = subprocess.CompletedProcess(
+        ["git", *args],
+        process.returncode,
+        stdout.decode() if stdout is not None else None,
+        stderr.decode() if stderr is not None else None,
+    )
+    if check and result.returncode != 0:
+        print(f"❌ Command failed: git {' '.join(args)}")
+        print(f"Error: {result.stderr if capture_output else f'exit status {result.returncode}'}")
+        sys.exit(1)
+    return result
+
+async def main():
     print("=== NrMAP GitHub Push Script ===")
     print()
 
@@ -44,12 +62,16 @@ def main():
         sys.exit(1)
 
     print("📁 Loading environment variables from .env...")
-    load_dotenv()
+    env_file = load_env_file(env_path)
+
+    def getenv(key, default=None):
+        # Variables already set in the environment take precedence over .env
+        return os.environ.get(key, env_file.get(key, default))
 
     # Get GitHub token (prefer GITHUB_TOKEN, fallback to GITHUB_TOKEN_DILIGENT)
-    github_token = os.getenv("GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN_DILIGENT")
-    github_repo = os.getenv("GITHUB_REPO", "deepskilling/RUSTSCAN")
-    github_user = os.getenv("GITHUB_USER", "deepskilling")
+    github_token = getenv("GITHUB_TOKEN") or getenv("GITHUB_TOKEN_DILIGENT")
+    github_repo = getenv("GITHUB_REPO", "deepskilling/RUSTSCAN")
+    github_user = getenv("GITHUB_USER", "deepskilling")
 
     if not github_token:
         print("❌ Error: GITHUB_TOKEN not set in .env file!")
@@ -64,34 +86,38 @@ def main():
     # Initialize git if needed
     if not Path(".git").exists():
         print("🔧 Initializing git repository...")
-        run_command("git init")
+        await run_git(["init"])
         print("✓ Git repository initialized")
     else:
         print("✓ Git repository already initialized")
 
-    # Configure git user
-    result = run_command("git config user.name", check=False, capture_output=True)
-    if not result or not result.stdout.strip():
+    # Probe user, remote and branch concurrently (read-only, independent)
+    user_result, remote_result, branch_result = await asyncio.gather(
+        run_git(["config", "user.name"], check=False, capture_output=True),
+        run_git(["remote", "get-url", "origin"], check=False, capture_output=True),
+        run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False, capture_output=True),
+    )
+
+    # Configure git user (sequential: concurrent writes contend for the config lock)
+    if not user_result.stdout.strip():
         print("🔧 Configuring git user...")
-        run_command(f'git config user.name "{github_user}"')
-        run_command(f'git config user.email "{github_user}@users.noreply.github.com"')
+        await run_git(["config", "user.name", github_user])
+        await run_git(["config", "user.email", f"{github_user}@users.noreply.github.com"])
         print("✓ Git user configured")
 
     # Set remote with token
     remote_url = f"https://{github_token}@github.com/{github_repo}.git"
     print("🔗 Setting remote repository...")
     
-    result = run_command("git remote get-url origin", check=False, capture_output=True)
-    if result and result.returncode == 0:
-        run_command(f'git remote set-url origin "{remote_url}"')
+    if remote_result.returncode == 0:
+        await run_git(["remote", "set-url", "origin", remote_url])
         print("✓ Remote URL updated")
     else:
-        run_command(f'git remote add origin "{remote_url}"')
+        await run_git(["remote", "add", "origin", remote_url])
         print("✓ Remote origin added")
 
     # Get current branch
-    result = run_command("git rev-parse --abbrev-ref HEAD", check=False, capture_output=True)
-    current_branch = result.stdout.strip() if result and result.returncode == 0 else "main"
+    current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "main"
     if current_branch == "HEAD":
         current_branch = "main"
 
@@ -104,11 +130,11 @@ def main():
 
     # Add all files
     print("📦 Adding files to git...")
-    run_command("git add .")
+    await run_git(["add", "-A"])
     print("✓ Files added")
 
     # Check if there are changes to commit
-    result = run_command("git diff --cached --quiet", check=False)
+    result = await run_git(["diff", "--cached", "--quiet"], check=False)
     if result.returncode == 0:
         print("ℹ️  No changes to commit")
     else:
@@ -134,7 +160,7 @@ Features:
 - Production-ready code quality
 - Extensive documentation"""
         
-        run_command(f'git commit -m "{commit_msg}"')
+        await run_git(["commit", "-m", commit_msg])
         print("✓ Commit created")
 
     # Push to GitHub
@@ -144,19 +170,8 @@ Features:
     print(f"  Branch: {current_branch}")
     print()
 
-    # Check if remote branch exists
-    result = run_command(
-        f"git rev-parse --verify origin/{current_branch}",
-        check=False,
-        capture_output=True
-    )
-    
-    if result and result.returncode == 0:
-        # Remote branch exists, do normal push
-        run_command(f"git push origin {current_branch}")
-    else:
-        # Remote branch doesn't exist, do initial push
-        run_command(f"git push -u origin {current_branch}")
+    # -u is harmless when the upstream is already set, so no need to probe for it
+    await run_git(["push", "-u", "origin", current_branch])
 
     print()
     print("✅ Successfully pushed to GitHub!")
@@ -175,11 +190,11 @@ Features:
 
     # Remove token from remote URL for security
     safe_remote_url = f"https://github.com/{github_repo}.git"
-    run_command(f'git remote set-url origin "{safe_remote_url}"')
+    await run_git(["remote", "set-url", "origin", safe_remote_url])
     print("🔒 Remote URL sanitized (token removed from git config)")
     print()
     print("✨ Done!")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
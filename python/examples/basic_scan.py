@@ -40,12 +40,16 @@ async def main():
     print("\n3. Multiple Targets")
     targets = ["127.0.0.1", "8.8.8.8"]
     
-    for target in targets:
-        try:
-            open_ports = await quick_scan(target, [22, 80, 443], scan_type="tcp")
-            print(f"   {target}: {len(open_ports)} open ports")
-        except Exception as e:
-            print(f"   {target}: Error - {e}")
+    # All targets are scanned concurrently in a single call
+    try:
+        results = await scanner.quick_scan_many(targets, [22, 80, 443])
+        for target, open_ports in results.items():
+            if isinstance(open_ports, dict):
+                print(f"   {target}: Error - {open_ports['error']}")
+            else:
+                print(f"   {target}: {len(open_ports)} open ports")
+    except Exception as e:
+        print(f"   Error - {e}")
     
     print("\n=== Example Complete ===")
 
@@ -11,7 +11,7 @@ from nrmap import (
     Scanner,
     DetectionEngine,
     OsFingerprintEngine,
-    generate_report,
+    ReportEngine,
     scan_network
 )
 
@@ -48,7 +48,7 @@ async def complete_scan_workflow(target: str, ports: list):
     print(f"   Status: {scan_result['host_status']}")
     print(f"   Scan duration: {scan_result['scan_duration_ms']}ms")
     
-    open_ports = [p['port'] for p in scan_result['tcp_results'] if p['open']]
+    open_ports = scan_result['open_ports']
     print(f"   Open ports: {open_ports}")
     print()
     
@@ -73,6 +73,8 @@ async def complete_scan_workflow(target: str, ports: list):
     # Step 4: OS fingerprinting
     print("🖥️  Step 3: OS Fingerprinting...")
     first_open_port = open_ports[0]
+    fingerprint: dict = {}
+    os_matches: list = []
     
     try:
         print(f"   Using port {first_open_port} for fingerprinting...")
@@ -81,15 +83,16 @@ async def complete_scan_workflow(target: str, ports: list):
         fingerprint = await os_engine.fingerprint(target, first_open_port)
         print(f"   Detection time: {fingerprint['detection_time_ms']}ms")
         
-        print("   Techniques used:")
+        lines = ["   Techniques used:"]
         if fingerprint['has_tcp']:
-            print("     ✓ TCP/IP Stack Analysis")
+            lines.append("     ✓ TCP/IP Stack Analysis")
         if fingerprint['has_icmp']:
-            print("     ✓ ICMP-Based Analysis")
+            lines.append("     ✓ ICMP-Based Analysis")
         if fingerprint['has_clock_skew']:
-            print("     ✓ Clock Skew Analysis")
+            lines.append("     ✓ Clock Skew Analysis")
             if 'clock_skew' in fingerprint and 'skew_ppm' in fingerprint['clock_skew']:
-                print(f"       Clock skew: {fingerprint['clock_skew']['skew_ppm']:.2f} ppm")
+                lines.append(f"       Clock skew: {fingerprint['clock_skew']['skew_ppm']:.2f} ppm")
+        print("\n".join(lines))
         
         # Match OS
         print()
@@ -97,17 +100,19 @@ async def complete_scan_workflow(target: str, ports: list):
         os_matches = await os_engine.detect_os(target, first_open_port)
         
         if os_matches:
-            print(f"   Top matches ({len(os_matches)} total):")
+            lines = [f"   Top matches ({len(os_matches)} total):"]
             for i, match in enumerate(os_matches[:3], 1):
                 conf = match['confidence_score'] * 100
-                print(f"     {i}. {match['os_name']}")
-                print(f"        Version: {match.get('os_version', 'Unknown')}")
-                print(f"        Family: {match['os_family']}")
-                print(f"        Confidence: {conf:.1f}%")
-                print(f"        Features matched: {len(match['matching_features'])}")
+                lines += [
+                    f"     {i}. {match['os_name']}",
+                    f"        Version: {match.get('os_version', 'Unknown')}",
+                    f"        Family: {match['os_family']}",
+                    f"        Confidence: {conf:.1f}%",
+                    f"        Features matched: {len(match['matching_features'])}",
+                ]
+            print("\n".join(lines))
     except Exception as e:
         print(f"   ⚠️  OS fingerprinting failed: {e}")
-        os_matches = []
     print()
     
     # Step 5: Generate comprehensive report
@@ -122,45 +127,44 @@ async def complete_scan_workflow(target: str, ports: list):
         "tcp_results": scan_result['tcp_results'],
         "services": services,
         "os_detection": {
-            "matches": os_matches[:3] if os_matches else [],
+            "matches": os_matches[:3],
             "fingerprint_data": {
-                "detection_time_ms": fingerprint.get('detection_time_ms', 0) if 'fingerprint' in locals() else 0,
+                "detection_time_ms": fingerprint.get('detection_time_ms', 0),
                 "techniques": {
-                    "tcp": fingerprint.get('has_tcp', False) if 'fingerprint' in locals() else False,
-                    "icmp": fingerprint.get('has_icmp', False) if 'fingerprint' in locals() else False,
-                    "clock_skew": fingerprint.get('has_clock_skew', False) if 'fingerprint' in locals() else False,
+                    "tcp": fingerprint.get('has_tcp', False),
+                    "icmp": fingerprint.get('has_icmp', False),
+                    "clock_skew": fingerprint.get('has_clock_skew', False),
                 }
             }
         }
     }
     
-    # Generate JSON report
-    json_report = generate_report(complete_results, "json_pretty", "complete_scan_report.json")
+    # Generate JSON, YAML and table reports in a single call
+    report_engine = ReportEngine()
+    reports = report_engine.generate_multi(complete_results, [
+        ("json_pretty", "complete_scan_report.json"),
+        ("yaml", "complete_scan_report.yaml"),
+        ("table", None),
+    ])
     print("   ✓ JSON report saved to: complete_scan_report.json")
-    
-    # Generate YAML report
-    yaml_report = generate_report(complete_results, "yaml", "complete_scan_report.yaml")
     print("   ✓ YAML report saved to: complete_scan_report.yaml")
-    
-    # Generate table report
-    table_report = generate_report(complete_results, "table")
     print("   ✓ Table report generated")
     print()
     
-    # Display summary
-    print("=" * 70)
-    print("📋 SCAN SUMMARY")
-    print("=" * 70)
-    print(f"Target:       {target}")
-    print(f"Open Ports:   {len(open_ports)}")
-    print(f"Services:     {len(services)} detected")
+    # Display summary (built up and written in one go)
+    lines = [
+        "=" * 70,
+        "📋 SCAN SUMMARY",
+        "=" * 70,
+        f"Target:       {target}",
+        f"Open Ports:   {len(open_ports)}",
+        f"Services:     {len(services)} detected",
+    ]
     if os_matches:
         best_match = os_matches[0]
-        print(f"OS Detected:  {best_match['os_name']} ({best_match['confidence_score']*100:.1f}% confidence)")
-    print("=" * 70)
-    print()
-    print("✅ Workflow complete!")
-    print()
+        lines.append(f"OS Detected:  {best_match['os_name']} ({best_match['confidence_score']*100:.1f}% confidence)")
+    lines += ["=" * 70, "", "✅ Workflow complete!", ""]
+    print("\n".join(lines))
 
 async def main():
     """Main entry point"""
@@ -17,8 +17,9 @@ async def main():
     # Perform scan
     print("1. Performing scan...")
     scanner = Scanner()
-    scan_data = await scanner.scan(target, ports, ["tcp"])
-    print(f"   Scanned {target}: {scan_data['scan_duration_ms']}ms\n")
+    # A native ScanResult goes to the report engine without a dict round-trip
+    scan_data = await scanner.scan(target, ports, ["tcp"], as_dict=False)
+    print(f"   Scanned {target}: {scan_data.scan_duration_ms}ms\n")
     
     # Generate reports in different formats
     report_engine = ReportEngine()
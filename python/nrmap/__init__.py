@@ -8,12 +8,15 @@ reconnaissance tool built in Rust.
 
 __version__ = "0.1.0"
 
+from collections.abc import Mapping
+
 try:
     from ._nrmap_rs import (
         # Phase 1: Core Scanner
         PyScanner as Scanner,
         PyHostStatus as HostStatus,
         PyScanResult as ScanResult,
+        PyScannerStats as ScannerStats,
         
         # Phase 2: Detection Engine
         PyDetectionEngine as DetectionEngine,
@@ -26,6 +29,8 @@ try:
         # Phase 4: Reporting
         PyReportEngine as ReportEngine,
         PyReportFormat as ReportFormat,
+        PyScanInput as ScanInput,
+        PyPortResult as PortResult,
     )
 except ImportError as e:
     raise ImportError(
@@ -33,6 +38,9 @@ except ImportError as e:
         "Please ensure the package is properly installed with: pip install -e ."
     )
 
+# ScannerStats replaces the dict get_stats() used to return
+Mapping.register(ScannerStats)
+
 # High-level API
 from .api import (
     quick_scan,
@@ -40,6 +48,7 @@ from .api import (
     detect_os,
     fingerprint_os,
     generate_report,
+    reset_engines,
 )
 
 __all__ = [
@@ -47,12 +56,15 @@ __all__ = [
     "Scanner",
     "HostStatus",
     "ScanResult",
+    "ScannerStats",
     "DetectionEngine",
     "ServiceInfo",
     "OsFingerprintEngine",
     "OsMatchResult",
     "ReportEngine",
     "ReportFormat",
+    "ScanInput",
+    "PortResult",
     
     # High-level API
     "quick_scan",
@@ -60,6 +72,7 @@ __all__ = [
     "detect_os",
     "fingerprint_os",
     "generate_report",
+    "reset_engines",
     
     # Version
     "__version__",
@@ -5,14 +5,79 @@ Provides convenient functions for common scanning tasks.
 """
 
 import asyncio
+import threading
 from typing import List, Dict, Optional, Union
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 from ._nrmap_rs import (
     PyScanner as Scanner,
     PyDetectionEngine as DetectionEngine,
     PyOsFingerprintEngine as OsFingerprintEngine,
     PyReportEngine as ReportEngine,
+    PyScanResult as ScanResult,
+    PyScanInput as ScanInput,
 )
 
+def _default_max_concurrency() -> int:
+    """Probe concurrency cap: a quarter of the open file limit, at most 256"""
+    if resource is None:
+        return 256
+    soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit == resource.RLIM_INFINITY:
+        return 256
+    return max(1, min(256, soft_limit // 4))
+
+
+# Default maximum number of service detection probes in flight at once
+_DEFAULT_MAX_CONCURRENCY = _default_max_concurrency()
+
+# Shared engine instances, created lazily on first use
+_engines: Dict[type, object] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_engine(engine_cls):
+    """Return the shared instance of an engine class, creating it on first use"""
+    engine = _engines.get(engine_cls)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(engine_cls)
+            if engine is None:
+                engine = _engines[engine_cls] = engine_cls()
+    return engine
+
+
+def reset_engines() -> None:
+    """
+    Drop the shared engine instances
+    
+    The next high-level API call creates fresh engines. Mainly useful in tests.
+    """
+    with _engines_lock:
+        _engines.clear()
+
+
+# Event loop backing the blocking wrappers, running on a daemon thread
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use"""
+    global _loop
+    loop = _loop
+    if loop is None:
+        with _loop_lock:
+            loop = _loop
+            if loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="nrmap-loop", daemon=True).start()
+                _loop = loop
+    return loop
+
 
 async def quick_scan(
     target: str,
@@ -34,7 +99,7 @@ async def quick_scan(
         >>> open_ports = await quick_scan("192.168.1.1", [22, 80, 443])
         >>> print(f"Open ports: {open_ports}")
     """
-    scanner = Scanner()
+    scanner = _get_engine(Scanner)
     result = await scanner.quick_scan(target, ports)
     return result
 
@@ -44,7 +109,8 @@ async def scan_network(
     ports: List[int],
     scan_types: Optional[List[str]] = None,
     detect_services: bool = False,
-    detect_os: bool = False
+    detect_os: bool = False,
+    max_concurrency: Optional[int] = None
 ) -> Dict:
     """
     Comprehensive network scan with optional service and OS detection
@@ -55,6 +121,8 @@ async def scan_network(
         scan_types: List of scan types (default: ["tcp"])
         detect_services: Enable service detection
         detect_os: Enable OS detection
+        max_concurrency: Maximum service detection probes in flight
+            (default: a quarter of the open file limit, at most 256)
     
     Returns:
         Complete scan results dictionary
@@ -68,42 +136,37 @@ async def scan_network(
         ... )
         >>> print(f"OS: {result.get('os', {}).get('os_name', 'Unknown')}")
     """
-    scanner = Scanner()
+    scanner = _get_engine(Scanner)
     scan_types = scan_types or ["tcp"]
     
     # Perform base scan
     result = await scanner.scan(target, ports, scan_types)
     
-    # Add service detection if requested
+    open_ports = result["open_ports"]
+    detection_engine = _get_engine(DetectionEngine) if detect_services else None
+    os_engine = _get_engine(OsFingerprintEngine) if detect_os else None
+    
+    async def _detect_services() -> None:
+        # One call for all ports; failures are reported per port
+        result["services"] = await detection_engine.detect_services_batch(
+            target, open_ports, max_concurrency or _DEFAULT_MAX_CONCURRENCY
+        )
+    
+    async def _detect_os() -> None:
+        # OS fingerprinting only needs the first open port
+        try:
+            os_matches = await os_engine.detect_os(target, open_ports[0])
+            result["os"] = os_matches[0] if os_matches else None
+        except Exception as e:
+            result["os"] = {"error": str(e)}
+    
+    # Service and OS detection are independent, so overlap them
+    tasks = []
     if detect_services:
-        detection_engine = DetectionEngine()
-        services = {}
-        for port_info in result.get("tcp_results", []):
-            if port_info["open"]:
-                port = port_info["port"]
-                try:
-                    service = await detection_engine.detect_service(target, port)
-                    services[port] = service
-                except Exception as e:
-                    services[port] = {"error": str(e)}
-        result["services"] = services
-    
-    # Add OS detection if requested
-    if detect_os:
-        os_engine = OsFingerprintEngine()
-        # Find first open port
-        open_port = None
-        for port_info in result.get("tcp_results", []):
-            if port_info["open"]:
-                open_port = port_info["port"]
-                break
-        
-        if open_port:
-            try:
-                os_matches = await os_engine.detect_os(target, open_port)
-                result["os"] = os_matches[0] if os_matches else None
-            except Exception as e:
-                result["os"] = {"error": str(e)}
+        tasks.append(_detect_services())
+    if detect_os and open_ports:
+        tasks.append(_detect_os())
+    await asyncio.gather(*tasks)
     
     return result
 
@@ -124,12 +187,14 @@ def detect_os(target: str, open_port: int, use_active_probes: bool = False) -> D
         >>> os_info = detect_os("192.168.1.1", 22)
         >>> print(f"OS: {os_info['os_name']}")
     """
+    engine = _get_engine(OsFingerprintEngine)
+    
     async def _detect():
-        engine = OsFingerprintEngine()
         matches = await engine.detect_os(target, open_port, None, use_active_probes)
         return matches[0] if matches else {"os_name": "Unknown", "confidence_score": 0.0}
     
-    return asyncio.run(_detect())
+    # Reuse one long-lived loop instead of creating and closing one per call
+    return asyncio.run_coroutine_threadsafe(_detect(), _get_loop()).result()
 
 
 async def fingerprint_os(
@@ -154,12 +219,12 @@ async def fingerprint_os(
         >>> fingerprint = await fingerprint_os("192.168.1.1", 22)
         >>> print(f"Detection techniques used: {fingerprint.get('has_tcp', False)}")
     """
-    engine = OsFingerprintEngine()
+    engine = _get_engine(OsFingerprintEngine)
     return await engine.fingerprint(target, open_port, closed_port, use_active_probes)
 
 
 def generate_report(
-    scan_data: Dict,
+    scan_data: Union[Dict, ScanResult, ScanInput],
     format: str = "json",
     output_path: Optional[str] = None
 ) -> str:
@@ -167,7 +232,7 @@ def generate_report(
     Generate a scan report
     
     Args:
-        scan_data: Scan results dictionary
+        scan_data: Scan results (dict, ScanResult or ScanInput)
         format: Output format ("json", "yaml", "html", "table")
         output_path: Optional file path to save report
     
@@ -178,6 +243,6 @@ def generate_report(
         >>> report = generate_report(scan_results, "json", "report.json")
         >>> print(report[:100])
     """
-    engine = ReportEngine()
+    engine = _get_engine(ReportEngine)
     return engine.generate_report(scan_data, format, output_path)
 
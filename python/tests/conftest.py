@@ -0,0 +1,65 @@
+"""
+Shared fixtures for the NrMAP Python bindings test suite
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from nrmap import PortResult, ReportEngine, ReportFormat, ScanInput
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+def pytest_configure(config):
+    """Run async tests on uvloop when it is installed
+    
+    Runs in every pytest-xdist worker process before collection, so each
+    worker gets its own uvloop policy.
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+@pytest.fixture(scope="session")
+def scan_input():
+    """Typed scan data shared by the reporting tests"""
+    return ScanInput(target="127.0.0.1", tcp_results=[PortResult(22, True)])
+
+@pytest.fixture(scope="module")
+def report_engine():
+    """ReportEngine shared by the tests of a module"""
+    return ReportEngine()
+
+@pytest.fixture(scope="module")
+def json_fmt():
+    """JSON ReportFormat shared by the tests of a module"""
+    return ReportFormat("json")
+
+@pytest.fixture(scope="module")
+def open_port():
+    """Ephemeral loopback port with a listener, so scans find it open
+    
+    Scanning it completes on the loopback handshake instead of waiting on
+    whatever daemons (or timeouts) ports like 22/80 happen to have.
+    """
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    yield listener.getsockname()[1]
+    listener.close()
+
+@pytest.fixture(scope="module")
+def closed_port():
+    """Ephemeral loopback port that refuses connections
+    
+    The socket stays bound (but never listens) so nothing else can claim
+    the port while the tests run.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    yield sock.getsockname()[1]
+    sock.close()
@@ -0,0 +1,87 @@
+"""
+Tests for the high-level API
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from nrmap import ReportEngine, detect_os, generate_report, reset_engines, scan_network
+from nrmap import api
+
+def _loop_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "nrmap-loop"]
+
+def test_shared_engines(scan_input):
+    """Test that high-level calls share one engine until reset_engines()"""
+    reset_engines()
+    
+    generate_report(scan_input, "json")
+    engine = api._engines[ReportEngine]
+    generate_report(scan_input, "yaml")
+    assert api._engines[ReportEngine] is engine
+    
+    reset_engines()
+    assert ReportEngine not in api._engines
+    
+    generate_report(scan_input, "json")
+    assert api._engines[ReportEngine] is not engine
+
+def test_detect_os_reuses_loop(open_port):
+    """Test that the blocking detect_os wrapper reuses one background loop"""
+    first = detect_os("127.0.0.1", open_port)
+    assert isinstance(first, dict)
+    loop = api._get_loop()
+    threads = _loop_threads()
+    assert len(threads) == 1
+    
+    second = detect_os("127.0.0.1", open_port)
+    assert isinstance(second, dict)
+    assert api._get_loop() is loop
+    assert _loop_threads() == threads
+    assert threads[0].is_alive()
+
+@pytest.mark.asyncio
+async def test_scan_network_with_detection(open_port):
+    """Test scan_network with concurrent service and OS detection"""
+    result = await scan_network(
+        "127.0.0.1",
+        [open_port],
+        detect_services=True,
+        detect_os=True,
+        max_concurrency=1
+    )
+    
+    assert result["open_ports"] == [open_port]
+    assert list(result["services"]) == [open_port]
+    assert "name" in result["services"][open_port] or "error" in result["services"][open_port]
+    assert "os" in result
+
+@pytest.mark.parametrize("soft_limit, expected", [
+    (64, 16),
+    (2, 1),
+    (1024, 256),
+    (1048576, 256),
+])
+def test_default_max_concurrency(monkeypatch, soft_limit, expected):
+    """Test the rlimit-derived default concurrency and its 256 cap"""
+    fake_resource = SimpleNamespace(
+        RLIMIT_NOFILE=7,
+        RLIM_INFINITY=-1,
+        getrlimit=lambda limit: (soft_limit, -1),
+    )
+    monkeypatch.setattr(api, "resource", fake_resource)
+    assert api._default_max_concurrency() == expected
+
+def test_default_max_concurrency_unlimited(monkeypatch):
+    """Test the default concurrency without a usable file limit"""
+    fake_resource = SimpleNamespace(
+        RLIMIT_NOFILE=7,
+        RLIM_INFINITY=-1,
+        getrlimit=lambda limit: (-1, -1),
+    )
+    monkeypatch.setattr(api, "resource", fake_resource)
+    assert api._default_max_concurrency() == 256
+    
+    monkeypatch.setattr(api, "resource", None)
+    assert api._default_max_concurrency() == 256
@@ -38,6 +38,19 @@ async def test_detect_service():
         # Expected if service not detected
         pass
 
+@pytest.mark.asyncio
+async def test_detect_services_batch(open_port, closed_port):
+    """Test batched service detection"""
+    engine = DetectionEngine()
+    
+    services = await engine.detect_services_batch("127.0.0.1", [open_port, closed_port])
+    assert isinstance(services, dict)
+    assert list(services) == [open_port, closed_port]
+    for service in services.values():
+        assert set(service) == {"name", "version", "confidence"}
+        assert isinstance(service["name"], str)
+        assert isinstance(service["confidence"], float)
+
 def test_detection_repr():
     """Test DetectionEngine __repr__"""
     engine = DetectionEngine()
@@ -3,12 +3,11 @@ Tests for Reporting bindings
 """
 
 import pytest
-from nrmap import ReportEngine, ReportFormat, generate_report
+from nrmap import ReportEngine, ReportFormat, Scanner, ScanResult, generate_report
 
-def test_report_engine_creation():
+def test_report_engine_creation(report_engine):
     """Test ReportEngine creation"""
-    engine = ReportEngine()
-    assert engine is not None
+    assert isinstance(report_engine, ReportEngine)
 
 def test_available_formats():
     """Test available report formats"""
@@ -19,46 +18,98 @@ def test_available_formats():
     assert "yaml" in formats
     assert "html" in formats
     assert "table" in formats
+    
+    # Callers get their own copy of the cached list
+    formats.clear()
+    assert "json" in ReportFormat.available_formats()
 
-def test_generate_report():
+def test_generate_report(report_engine, scan_input):
     """Test report generation"""
-    engine = ReportEngine()
+    engine = report_engine
+    
+    # JSON and YAML in one call
+    reports = engine.generate_reports(scan_input, ["json", "yaml"])
+    assert set(reports) == {"json", "yaml"}
+    assert all(isinstance(report, str) for report in reports.values())
+    assert len(reports["json"]) > 0
+    
+    # Single-format calls produce the same output
+    assert engine.generate_report(scan_input, "json") == reports["json"]
+    assert engine.generate_report(scan_input, "yaml") == reports["yaml"]
+
+def test_generate_report_bytes(report_engine, scan_input, tmp_path):
+    """Test report generation as bytes"""
+    engine = report_engine
+    html_path = tmp_path / "report.html"
+    
+    report = engine.generate_report_bytes(scan_input, "html", str(html_path))
+    assert isinstance(report, bytes)
+    assert report.decode() == engine.generate_report(scan_input, "html")
+    assert html_path.read_bytes() == report
+    
+    with pytest.raises(ValueError):
+        engine.generate_report_bytes(scan_input, "bogus")
+
+@pytest.mark.asyncio
+async def test_generate_report_from_scan_result(report_engine, open_port):
+    """Test report generation from a native ScanResult"""
+    engine = report_engine
+    
+    scan_result = await Scanner().scan("127.0.0.1", [open_port], ["tcp"], as_dict=False)
+    assert isinstance(scan_result, ScanResult)
+    assert scan_result.open_ports == [open_port]
+    
+    report = engine.generate_report(scan_result, "json")
+    assert isinstance(report, str)
+    
+    with pytest.raises(TypeError):
+        engine.generate_report(["not", "scan", "data"], "json")
+
+def test_generate_multi(report_engine, tmp_path):
+    """Test generating several formats in one call"""
+    engine = report_engine
     
     scan_data = {
         "target": "127.0.0.1",
         "tcp_results": [{"port": 22, "open": True}]
     }
+    json_path = tmp_path / "report.json"
     
-    # JSON format
-    report = engine.generate_report(scan_data, "json")
-    assert isinstance(report, str)
-    assert len(report) > 0
+    reports = engine.generate_multi(scan_data, [("json", str(json_path)), ("table", None)])
+    assert set(reports) == {"json", "table"}
+    assert all(isinstance(report, str) for report in reports.values())
+    assert json_path.read_text() == reports["json"]
     
-    # YAML format
-    report = engine.generate_report(scan_data, "yaml")
-    assert isinstance(report, str)
+    with pytest.raises(ValueError):
+        engine.generate_multi(scan_data, [("json", None), ("bogus", None)])
 
-def test_generate_report_high_level():
+def test_generate_report_high_level(scan_input):
     """Test high-level generate_report function"""
-    scan_data = {
-        "target": "192.168.1.1",
-        "tcp_results": []
-    }
-    
-    report = generate_report(scan_data, "json")
+    report = generate_report(scan_input, "json")
     assert isinstance(report, str)
 
-def test_report_format_creation():
+def test_scan_input(scan_input):
+    """Test ScanInput fields and immutability"""
+    assert scan_input.target == "127.0.0.1"
+    assert scan_input.tcp_results[0].port == 22
+    assert scan_input.tcp_results[0].open is True
+    assert "ScanInput" in repr(scan_input)
+    
+    with pytest.raises(AttributeError):
+        scan_input.target = "10.0.0.1"
+
+def test_report_format_creation(json_fmt):
     """Test ReportFormat creation"""
-    fmt = ReportFormat("json")
-    assert fmt is not None
-    repr_str = repr(fmt)
+    assert json_fmt is not None
+    repr_str = repr(json_fmt)
     assert "ReportFormat" in repr_str
     assert "json" in repr_str
+    
+    with pytest.raises(ValueError):
+        ReportFormat("bogus")
 
-def test_report_engine_repr():
+def test_report_engine_repr(report_engine):
     """Test ReportEngine __repr__"""
-    engine = ReportEngine()
-    repr_str = repr(engine)
+    repr_str = repr(report_engine)
     assert "PyReportEngine" in repr_str
 
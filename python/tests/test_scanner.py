@@ -2,6 +2,9 @@
 Tests for Scanner bindings
 """
 
+import json
+from collections.abc import Mapping
+
 import pytest
 from nrmap import Scanner, quick_scan
 
@@ -14,28 +17,52 @@ async def test_scanner_creation():
     assert "version" in stats
     assert "scanner_type" in stats
 
+def test_scanner_stats():
+    """Test ScannerStats dict-style access"""
+    scanner = Scanner()
+    stats = scanner.get_stats()
+    
+    assert stats is scanner.get_stats()
+    assert stats["scanner_type"] == "NrMAP"
+    assert stats.to_dict() == {"version": stats["version"], "scanner_type": "NrMAP"}
+    assert "missing" not in stats
+    with pytest.raises(KeyError):
+        stats["missing"]
+    
+    # Mapping protocol, as callers of the old dict expect
+    assert isinstance(stats, Mapping)
+    assert len(stats) == 2
+    assert list(stats) == ["version", "scanner_type"]
+    assert dict(stats) == stats.to_dict()
+    assert dict(stats.items()) == stats.to_dict()
+    assert stats.get("scanner_type") == "NrMAP"
+    assert stats.get("missing") is None
+    assert stats.get("missing", "n/a") == "n/a"
+    assert json.loads(json.dumps(stats.to_dict())) == dict(stats)
+
 @pytest.mark.asyncio
-async def test_quick_scan():
+async def test_quick_scan(open_port):
     """Test quick_scan function"""
-    # Test localhost (should be safe)
-    result = await quick_scan("127.0.0.1", [22, 80, 443])
-    assert isinstance(result, list)
-    assert all(isinstance(port, int) for port in result)
+    result = await quick_scan("127.0.0.1", [open_port])
+    assert result == [open_port]
 
 @pytest.mark.asyncio
-async def test_scanner_scan():
+async def test_scanner_scan(open_port):
     """Test Scanner.scan method"""
     scanner = Scanner()
-    result = await scanner.scan("127.0.0.1", [22, 80], ["tcp"])
+    result = await scanner.scan("127.0.0.1", [open_port], ["tcp"])
     
     assert "target" in result
     assert "host_status" in result
     assert "scan_duration_ms" in result
     assert "tcp_results" in result
+    assert "open_ports" in result
     
     assert result["target"] == "127.0.0.1"
     assert isinstance(result["scan_duration_ms"], int)
     assert isinstance(result["tcp_results"], list)
+    assert result["open_ports"] == [p["port"] for p in result["tcp_results"] if p["open"]]
+    assert result["open_ports"] == [open_port]
 
 def test_scanner_repr():
     """Test Scanner __repr__"""
@@ -44,3 +71,11 @@ def test_scanner_repr():
     assert "PyScanner" in repr_str
     assert "version" in repr_str
 
+
+@pytest.mark.asyncio
+async def test_quick_scan_many(open_port):
+    """Test Scanner.quick_scan_many method"""
+    scanner = Scanner()
+    result = await scanner.quick_scan_many(["127.0.0.1"], [open_port])
+    
+    assert result == {"127.0.0.1": [open_port]}
@@ -26,6 +26,7 @@ fn _nrmap_rs(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<phase1_scanner::PyScanner>()?;
     m.add_class::<phase1_scanner::PyHostStatus>()?;
     m.add_class::<phase1_scanner::PyScanResult>()?;
+    m.add_class::<phase1_scanner::PyScannerStats>()?;
     
     // Phase 2: Detection Engine
     m.add_class::<phase2_detection::PyDetectionEngine>()?;
@@ -38,6 +39,8 @@ fn _nrmap_rs(_py: Python, m: &PyModule) -> PyResult<()> {
     // Phase 4: Reporting
     m.add_class::<phase4_reporting::PyReportEngine>()?;
     m.add_class::<phase4_reporting::PyReportFormat>()?;
+    m.add_class::<phase4_reporting::PyScanInput>()?;
+    m.add_class::<phase4_reporting::PyPortResult>()?;
     
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
     
@@ -7,20 +7,26 @@
 //! - UDP scan
 //! - Adaptive throttling
 
+use futures::stream::{self, StreamExt};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyIterator, PyList, PyTuple};
 use pyo3_asyncio::tokio::future_into_py;
 use std::net::IpAddr;
 use std::sync::Arc;
+use tracing::warn;
 
 use crate::config::AppConfig;
-use crate::scanner::{Scanner, ScanType};
+use crate::scanner::{CompleteScanResult, Scanner, ScanType, MAX_CONCURRENT_TARGETS};
 use crate::scanner::host_discovery::HostStatus;
+use crate::scanner::tcp_connect::PortStatus;
 
 /// Python wrapper for Scanner
 #[pyclass]
 pub struct PyScanner {
     scanner: Arc<Scanner>,
+    /// Statistics object, built on the first get_stats() call
+    stats: GILOnceCell<Py<PyScannerStats>>,
 }
 
 #[pymethods]
@@ -47,6 +53,7 @@ impl PyScanner {
         
         Ok(PyScanner { 
             scanner: Arc::new(scanner),
+            stats: GILOnceCell::new(),
         })
     }
 
@@ -56,15 +63,26 @@ impl PyScanner {
     ///     target (str): Target IP address or hostname
     ///     ports (list[int]): List of ports to scan
     ///     scan_types (list[str], optional): Scan types ["tcp", "syn", "udp"]
+    ///     as_dict (bool, optional): Return a dict (default) or a ScanResult
     /// 
     /// Returns:
-    ///     dict: Scan results with host status and port information
+    ///     dict: Scan results with host status and port information;
+    ///         "open_ports" lists the open TCP ports
+    ///     ScanResult: If as_dict is False; skips building the per-port dicts
+    ///         and can be passed straight to ReportEngine.generate_report
     /// 
     /// Example:
     ///     >>> result = scanner.scan("192.168.1.1", [22, 80, 443], ["tcp"])
     ///     >>> print(result["host_status"])
-    #[pyo3(signature = (target, ports, scan_types=None))]
-    fn scan<'a>(&self, py: Python<'a>, target: String, ports: Vec<u16>, scan_types: Option<Vec<String>>) -> PyResult<&'a PyAny> {
+    #[pyo3(signature = (target, ports, scan_types=None, as_dict=true))]
+    fn scan<'a>(
+        &self,
+        py: Python<'a>,
+        target: String,
+        ports: Vec<u16>,
+        scan_types: Option<Vec<String>>,
+        as_dict: bool,
+    ) -> PyResult<&'a PyAny> {
         let scanner = Arc::clone(&self.scanner);
         let target_ip: IpAddr = target.parse()
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid IP: {}", e)))?;
@@ -85,6 +103,10 @@ impl PyScanner {
                 .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Scan failed: {}", e)))?;
             
             Python::with_gil(|py| {
+                if !as_dict {
+                    return Ok(Py::new(py, PyScanResult::from(&result))?.into_py(py));
+                }
+                
                 let dict = PyDict::new(py);
                 dict.set_item("target", result.target.to_string())?;
                 dict.set_item("host_status", format!("{:?}", result.host_status))?;
@@ -92,6 +114,7 @@ impl PyScanner {
                 
                 // TCP results
                 let tcp_list = PyList::empty(py);
+                let open_ports = PyList::empty(py);
                 for tcp_result in &result.tcp_results {
                     let tcp_dict = PyDict::new(py);
                     tcp_dict.set_item("port", tcp_result.port)?;
@@ -99,8 +122,12 @@ impl PyScanner {
                     tcp_dict.set_item("open", is_open)?;
                     tcp_dict.set_item("response_time_ms", tcp_result.response_time_ms)?;
                     tcp_list.append(tcp_dict)?;
+                    if is_open {
+                        open_ports.append(tcp_result.port)?;
+                    }
                 }
                 dict.set_item("tcp_results", tcp_list)?;
+                dict.set_item("open_ports", open_ports)?;
                 
                 // SYN results
                 let syn_list = PyList::empty(py);
@@ -128,13 +155,19 @@ impl PyScanner {
                 }
                 dict.set_item("udp_results", udp_list)?;
                 
-                Ok::<Py<PyDict>, PyErr>(dict.into())
+                Ok::<PyObject, PyErr>(dict.into_py(py))
             })
         })
     }
 
     /// Quick TCP scan (convenience method)
     /// 
+    /// On Linux builds with the "uring" feature the connects are submitted
+    /// through io_uring, honouring the tcp_connect timeout and retries and
+    /// max_concurrent_scans; otherwise (on kernels without
+    /// IORING_OP_CONNECT, or if the batch fails) the regular TCP connect
+    /// scanner is used.
+    /// 
     /// Args:
     ///     target (str): Target IP address
     ///     ports (list[int]): List of ports to scan
@@ -151,6 +184,26 @@ impl PyScanner {
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid IP: {}", e)))?;
 
         future_into_py(py, async move {
+            // Batch every connect through one io_uring when the kernel allows it
+            #[cfg(all(target_os = "linux", feature = "uring"))]
+            if crate::scanner::uring_connect::is_supported() {
+                let tcp_config = scanner.config().tcp_connect.clone();
+                let max_in_flight = scanner.config().max_concurrent_scans;
+                let batch_ports = ports.clone();
+                let batch = tokio::task::spawn_blocking(move || {
+                    crate::scanner::uring_connect::connect_batch(target_ip, &batch_ports, &tcp_config, max_in_flight)
+                })
+                .await;
+                
+                match batch {
+                    Ok(Ok(open_ports)) => {
+                        return Python::with_gil(|py| Ok::<Py<PyList>, PyErr>(PyList::new(py, open_ports).into()));
+                    }
+                    Ok(Err(e)) => warn!("io_uring connect batch failed, falling back to TCP connect scan: {}", e),
+                    Err(e) => warn!("io_uring connect batch did not complete, falling back to TCP connect scan: {}", e),
+                }
+            }
+            
             let result = scanner.scan(target_ip, ports, vec![ScanType::TcpConnect]).await
                 .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Scan failed: {}", e)))?;
             
@@ -167,6 +220,77 @@ impl PyScanner {
         })
     }
 
+    /// Quick TCP scan of several targets at once
+    /// 
+    /// Targets are scanned concurrently on the Rust side in a single call,
+    /// at most MAX_CONCURRENT_TARGETS (10) at a time.
+    /// 
+    /// Args:
+    ///     targets (list[str]): Target IP addresses
+    ///     ports (list[int]): List of ports to scan on every target
+    /// 
+    /// Returns:
+    ///     dict[str, list[int] | dict]: Open ports per target, in input
+    ///         order, or {"error": str} if that target's scan failed
+    /// 
+    /// Example:
+    ///     >>> results = await scanner.quick_scan_many(["192.168.1.1", "192.168.1.2"], [22, 80])
+    ///     >>> for host, open_ports in results.items():
+    ///     ...     print(f"{host}: {open_ports}")
+    fn quick_scan_many<'a>(&self, py: Python<'a>, targets: Vec<String>, ports: Vec<u16>) -> PyResult<&'a PyAny> {
+        let scanner = Arc::clone(&self.scanner);
+        let target_ips = targets.into_iter()
+            .map(|target| {
+                let ip: IpAddr = target.parse()
+                    .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid IP: {}", e)))?;
+                Ok((target, ip))
+            })
+            .collect::<PyResult<Vec<(String, IpAddr)>>>()?;
+
+        future_into_py(py, async move {
+            // Same bound as Scanner::scan_multiple: every target scan holds
+            // its own discovery and port sockets open
+            let results = stream::iter(target_ips)
+                .map(|(target, ip)| {
+                    let scanner = Arc::clone(&scanner);
+                    let ports = ports.clone();
+                    async move {
+                        let result = scanner.scan(ip, ports, vec![ScanType::TcpConnect]).await;
+                        if let Err(e) = &result {
+                            warn!("Scan failed for {}: {}", target, e);
+                        }
+                        (target, result)
+                    }
+                })
+                .buffered(MAX_CONCURRENT_TARGETS)
+                .collect::<Vec<_>>()
+                .await;
+            
+            Python::with_gil(|py| {
+                let dict = PyDict::new(py);
+                for (target, result) in results {
+                    match result {
+                        Ok(result) => {
+                            let open_ports = PyList::empty(py);
+                            for tcp_result in &result.tcp_results {
+                                if matches!(tcp_result.status, PortStatus::Open) {
+                                    open_ports.append(tcp_result.port)?;
+                                }
+                            }
+                            dict.set_item(target, open_ports)?;
+                        }
+                        Err(e) => {
+                            let error_dict = PyDict::new(py);
+                            error_dict.set_item("error", format!("Scan failed: {}", e))?;
+                            dict.set_item(target, error_dict)?;
+                        }
+                    }
+                }
+                Ok::<Py<PyDict>, PyErr>(dict.into())
+            })
+        })
+    }
+
     /// Discover live hosts in a range
     /// 
     /// Args:
@@ -209,19 +333,110 @@ impl PyScanner {
 
     /// Get scanner statistics
     /// 
+    /// The same immutable object is returned on every call.
+    /// 
     /// Returns:
-    ///     dict: Scanner statistics and configuration
-    fn get_stats(&self) -> PyResult<Py<PyDict>> {
+    ///     ScannerStats: Scanner statistics, readable like a dict
+    /// 
+    /// Example:
+    ///     >>> stats = scanner.get_stats()
+    ///     >>> print(stats["version"])
+    fn get_stats(&self, py: Python<'_>) -> PyResult<Py<PyScannerStats>> {
+        let stats = self.stats.get_or_try_init(py, || {
+            Py::new(py, PyScannerStats {
+                version: env!("CARGO_PKG_VERSION"),
+                scanner_type: "NrMAP",
+            })
+        })?;
+        Ok(stats.clone_ref(py))
+    }
+
+    fn __repr__(&self) -> String {
+        format!("PyScanner(version={})", env!("CARGO_PKG_VERSION"))
+    }
+}
+
+/// Scanner statistics
+/// 
+/// A read-only mapping with the same keys as the dict it replaces; it is
+/// registered as a collections.abc.Mapping. Use to_dict() where a real
+/// dict is required (e.g. json.dumps).
+#[pyclass(frozen, get_all)]
+pub struct PyScannerStats {
+    version: &'static str,
+    scanner_type: &'static str,
+}
+
+impl PyScannerStats {
+    const KEYS: [&'static str; 2] = ["version", "scanner_type"];
+
+    fn lookup(&self, key: &str) -> Option<&'static str> {
+        match key {
+            "version" => Some(self.version),
+            "scanner_type" => Some(self.scanner_type),
+            _ => None,
+        }
+    }
+
+    fn lookup_any(&self, key: &PyAny) -> Option<&'static str> {
+        key.extract::<&str>().ok().and_then(|k| self.lookup(k))
+    }
+}
+
+#[pymethods]
+impl PyScannerStats {
+    fn __contains__(&self, key: &PyAny) -> bool {
+        self.lookup_any(key).is_some()
+    }
+
+    fn __getitem__(&self, key: &str) -> PyResult<&'static str> {
+        self.lookup(key)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(key.to_string()))
+    }
+
+    fn __len__(&self) -> usize {
+        Self::KEYS.len()
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<&'py PyIterator> {
+        PyTuple::new(py, Self::KEYS).as_ref().iter()
+    }
+
+    /// Return the value for key, or default if the key is missing
+    #[pyo3(signature = (key, default=None))]
+    fn get(&self, py: Python<'_>, key: &PyAny, default: Option<PyObject>) -> Option<PyObject> {
+        match self.lookup_any(key) {
+            Some(value) => Some(value.into_py(py)),
+            None => default,
+        }
+    }
+
+    fn keys(&self) -> Vec<&'static str> {
+        Self::KEYS.to_vec()
+    }
+
+    fn values(&self) -> Vec<&'static str> {
+        vec![self.version, self.scanner_type]
+    }
+
+    fn items(&self) -> Vec<(&'static str, &'static str)> {
+        Self::KEYS.into_iter().zip(self.values()).collect()
+    }
+
+    fn to_dict(&self) -> PyResult<Py<PyDict>> {
         Python::with_gil(|py| {
             let dict = PyDict::new(py);
-            dict.set_item("version", env!("CARGO_PKG_VERSION"))?;
-            dict.set_item("scanner_type", "NrMAP")?;
+            dict.set_item("version", self.version)?;
+            dict.set_item("scanner_type", self.scanner_type)?;
             Ok(dict.into())
         })
     }
 
     fn __repr__(&self) -> String {
-        format!("PyScanner(version={})", env!("CARGO_PKG_VERSION"))
+        format!(
+            "ScannerStats(version={}, scanner_type={})",
+            self.version, self.scanner_type
+        )
     }
 }
 
@@ -255,11 +470,13 @@ impl PyHostStatus {
 
 /// Python wrapper for scan results
 #[pyclass]
-#[derive(Clone)]
+#[derive(Clone, Hash)]
 pub struct PyScanResult {
     #[pyo3(get)]
     target: String,
     #[pyo3(get)]
+    host_status: String,
+    #[pyo3(get)]
     open_ports: Vec<u16>,
     #[pyo3(get)]
     closed_ports: Vec<u16>,
@@ -267,6 +484,25 @@ pub struct PyScanResult {
     scan_duration_ms: u64,
 }
 
+impl From<&CompleteScanResult> for PyScanResult {
+    fn from(result: &CompleteScanResult) -> Self {
+        let ports_with = |status: PortStatus| {
+            result.tcp_results.iter()
+                .filter(|r| r.status == status)
+                .map(|r| r.port)
+                .collect::<Vec<u16>>()
+        };
+        
+        PyScanResult {
+            target: result.target.to_string(),
+            host_status: format!("{:?}", result.host_status),
+            open_ports: ports_with(PortStatus::Open),
+            closed_ports: ports_with(PortStatus::Closed),
+            scan_duration_ms: result.scan_duration_ms,
+        }
+    }
+}
+
 #[pymethods]
 impl PyScanResult {
     fn __repr__(&self) -> String {
@@ -282,6 +518,7 @@ impl PyScanResult {
         Python::with_gil(|py| {
             let dict = PyDict::new(py);
             dict.set_item("target", &self.target)?;
+            dict.set_item("host_status", &self.host_status)?;
             dict.set_item("open_ports", &self.open_ports)?;
             dict.set_item("closed_ports", &self.closed_ports)?;
             dict.set_item("scan_duration_ms", self.scan_duration_ms)?;
@@ -10,8 +10,43 @@ use pyo3::types::PyDict;
 use pyo3_asyncio::tokio::future_into_py;
 use std::net::IpAddr;
 use std::sync::Arc;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 
-use crate::detection::{DetectionEngine, DetectionEngineConfig};
+use crate::detection::{DetectionEngine, DetectionEngineConfig, ServiceFingerprint};
+
+/// Grab a banner from a port and match it against the fingerprint database
+async fn detect_service_on(
+    engine: &DetectionEngine,
+    target: IpAddr,
+    port: u16,
+) -> Result<Option<ServiceFingerprint>, String> {
+    let banner = engine.grab_banner(target, port).await
+        .map_err(|e| format!("Banner grab failed: {}", e))?;
+    
+    let banner_str = banner.as_ref().map(|b| b.data.as_str());
+    
+    engine.detect_service(target, port, banner_str).await
+        .map_err(|e| format!("Detection failed: {}", e))
+}
+
+/// Convert a service detection outcome into a Python dict
+fn service_to_dict(py: Python<'_>, service: Option<ServiceFingerprint>) -> PyResult<&PyDict> {
+    let dict = PyDict::new(py);
+    match service {
+        Some(service_info) => {
+            dict.set_item("name", service_info.service_name)?;
+            dict.set_item("version", service_info.version.unwrap_or_else(|| "Unknown".to_string()))?;
+            dict.set_item("confidence", service_info.confidence)?;
+        }
+        None => {
+            dict.set_item("name", "Unknown")?;
+            dict.set_item("version", "Unknown")?;
+            dict.set_item("confidence", 0.0)?;
+        }
+    }
+    Ok(dict)
+}
 
 /// Python wrapper for Detection Engine
 #[pyclass]
@@ -83,36 +118,80 @@ impl PyDetectionEngine {
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid IP: {}", e)))?;
 
         future_into_py(py, async move {
-            // First grab banner
-            let banner = engine.grab_banner(target_ip, port).await
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Banner grab failed: {}", e)))?;
+            let service = detect_service_on(&engine, target_ip, port).await
+                .map_err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>)?;
+            
+            Python::with_gil(|py| {
+                Ok::<Py<PyDict>, PyErr>(service_to_dict(py, service)?.into())
+            })
+        })
+    }
+
+    /// Detect services on several ports of one target in a single call
+    /// 
+    /// Ports are probed concurrently on the Rust side, so the whole batch
+    /// costs one Python/Rust round-trip instead of one per port.
+    /// 
+    /// Args:
+    ///     target (str): Target IP address
+    ///     ports (list[int]): Port numbers
+    ///     max_concurrency (int, optional): Maximum probes in flight (default: 32)
+    /// 
+    /// Returns:
+    ///     dict[int, dict]: Service information per port, or {"error": str}
+    ///     for ports where detection failed
+    /// 
+    /// Example:
+    ///     >>> services = await engine.detect_services_batch("192.168.1.1", [22, 80])
+    ///     >>> print(f"Port 22: {services[22]['name']}")
+    #[pyo3(signature = (target, ports, max_concurrency=32))]
+    fn detect_services_batch<'a>(
+        &self,
+        py: Python<'a>,
+        target: String,
+        ports: Vec<u16>,
+        max_concurrency: usize,
+    ) -> PyResult<&'a PyAny> {
+        let engine = Arc::clone(&self.engine);
+        let target_ip: IpAddr = target.parse()
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid IP: {}", e)))?;
+
+        future_into_py(py, async move {
+            let semaphore = Arc::new(Semaphore::new(max_concurrency.max(1)));
+            let mut tasks = JoinSet::new();
             
-            let banner_str = banner.as_ref().map(|b| b.data.as_str());
+            for (index, port) in ports.into_iter().enumerate() {
+                let engine = Arc::clone(&engine);
+                let semaphore = Arc::clone(&semaphore);
+                tasks.spawn(async move {
+                    let _permit = semaphore.acquire_owned().await;
+                    (index, port, detect_service_on(&engine, target_ip, port).await)
+                });
+            }
             
-            // Then detect service
-            match engine.detect_service(target_ip, port, banner_str).await {
-                Ok(Some(service_info)) => {
-                    Python::with_gil(|py| {
-                        let dict = PyDict::new(py);
-                        dict.set_item("name", service_info.service_name)?;
-                        dict.set_item("version", service_info.version.unwrap_or_else(|| "Unknown".to_string()))?;
-                        dict.set_item("confidence", service_info.confidence)?;
-                        Ok::<Py<PyDict>, PyErr>(dict.into())
-                    })
-                }
-                Ok(None) => {
-                    Python::with_gil(|py| {
-                        let dict = PyDict::new(py);
-                        dict.set_item("name", "Unknown")?;
-                        dict.set_item("version", "Unknown")?;
-                        dict.set_item("confidence", 0.0)?;
-                        Ok::<Py<PyDict>, PyErr>(dict.into())
-                    })
-                }
-                Err(e) => {
-                    Python::with_gil(|_| Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Detection failed: {}", e))))
-                }
+            let mut outcomes = Vec::with_capacity(tasks.len());
+            while let Some(joined) = tasks.join_next().await {
+                outcomes.push(joined.map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Detection task failed: {}", e))
+                })?);
             }
+            // Report ports in the order they were requested
+            outcomes.sort_unstable_by_key(|(index, _, _)| *index);
+            
+            Python::with_gil(|py| {
+                let services = PyDict::new(py);
+                for (_, port, outcome) in outcomes {
+                    match outcome {
+                        Ok(service) => services.set_item(port, service_to_dict(py, service)?)?,
+                        Err(message) => {
+                            let error_dict = PyDict::new(py);
+                            error_dict.set_item("error", message)?;
+                            services.set_item(port, error_dict)?;
+                        }
+                    }
+                }
+                Ok::<Py<PyDict>, PyErr>(services.into())
+            })
         })
     }
 
@@ -14,12 +14,14 @@ use pyo3_asyncio::tokio::future_into_py;
 use std::net::IpAddr;
 use std::sync::Arc;
 
-use crate::os_fingerprint::{OsFingerprintEngine, OsFingerprintDatabase};
+use crate::os_fingerprint::OsFingerprintEngine;
 
 /// Python wrapper for OS Fingerprinting Engine
 #[pyclass]
 pub struct PyOsFingerprintEngine {
     engine: Arc<OsFingerprintEngine>,
+    /// Signature count, fixed once the engine's database is loaded
+    signature_count: usize,
 }
 
 #[pymethods]
@@ -31,8 +33,10 @@ impl PyOsFingerprintEngine {
     #[new]
     fn new() -> PyResult<Self> {
         let engine = OsFingerprintEngine::new();
+        let signature_count = engine.database().signatures().len();
         Ok(PyOsFingerprintEngine { 
             engine: Arc::new(engine),
+            signature_count,
         })
     }
 
@@ -176,18 +180,15 @@ impl PyOsFingerprintEngine {
     fn get_database_info(&self) -> PyResult<Py<PyDict>> {
         Python::with_gil(|py| {
             let dict = PyDict::new(py);
-            // Create a temporary database to get count
-            let db = OsFingerprintDatabase::new();
-            dict.set_item("signature_count", db.signatures().len())?;
+            dict.set_item("signature_count", self.signature_count)?;
             Ok(dict.into())
         })
     }
 
     fn __repr__(&self) -> String {
-        let db = OsFingerprintDatabase::new();
         format!(
             "PyOsFingerprintEngine(signatures={})",
-            db.signatures().len()
+            self.signature_count
         )
     }
 }
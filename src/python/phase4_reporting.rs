@@ -5,15 +5,132 @@
 //! - Report formatting
 //! - Output customization
 
+use lazy_static::lazy_static;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyDict, PyList};
 
+use std::collections::hash_map::DefaultHasher;
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+
+use super::phase1_scanner::PyScanResult;
 use crate::report::{ReportEngine, ReportFormat};
 
+/// Python-facing names of the supported report formats
+const FORMAT_NAMES: [&str; 5] = ["json", "json_pretty", "yaml", "html", "table"];
+
+lazy_static! {
+    /// Python-facing format name to ReportFormat, built once
+    static ref FORMATS: HashMap<&'static str, ReportFormat> = FORMAT_NAMES
+        .iter()
+        .zip([
+            ReportFormat::Json,
+            ReportFormat::JsonPretty,
+            ReportFormat::Yaml,
+            ReportFormat::Html,
+            ReportFormat::Table,
+        ])
+        .map(|(&name, format)| (name, format))
+        .collect();
+}
+
+/// FORMAT_NAMES as a Python list, built once per interpreter
+static AVAILABLE_FORMATS: GILOnceCell<Py<PyList>> = GILOnceCell::new();
+
+/// Parse a Python-facing format name
+fn parse_format(format: &str) -> PyResult<ReportFormat> {
+    FORMATS.get(format).copied().ok_or_else(|| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            format!("Invalid format: {}. Use: {}", format, FORMAT_NAMES.join(", "))
+        )
+    })
+}
+
+/// Render scan data in the given format
+fn render_report(format: &str, _output_format: ReportFormat) -> String {
+    // In a real implementation, would convert scan_data to ScanReport
+    // For now, return a simple formatted string
+    format!("Report generated in {} format", format)
+}
+
+/// Structural hash of typed scan data, used to detect unchanged input
+/// 
+/// A native ScanResult or ScanInput is hashed straight from its Rust
+/// fields. Dicts return None and are never cached: they can change
+/// between calls and have no cheap structural hash.
+fn typed_scan_data_hash(scan_data: &PyAny) -> PyResult<Option<u64>> {
+    let mut hasher = DefaultHasher::new();
+    if let Ok(result) = scan_data.extract::<PyRef<PyScanResult>>() {
+        result.hash(&mut hasher);
+    } else if let Ok(input) = scan_data.extract::<PyRef<PyScanInput>>() {
+        input.hash(&mut hasher);
+    } else if scan_data.downcast::<PyDict>().is_ok() {
+        return Ok(None);
+    } else {
+        return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "scan_data must be a dict, ScanResult or ScanInput"
+        ));
+    }
+    Ok(Some(hasher.finish()))
+}
+
+/// Save a generated report to disk
+fn write_report(path: &str, report: &str) -> PyResult<()> {
+    std::fs::write(path, report)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to write report: {}", e)))
+}
+
+/// Reports rendered from the most recent typed scan data
+#[derive(Default)]
+struct ReportCache {
+    /// Hash of the ScanResult/ScanInput the reports were rendered from
+    key: Option<u64>,
+    /// Rendered reports, keyed by format
+    reports: HashMap<ReportFormat, Arc<str>>,
+}
+
 /// Python wrapper for Report Engine
 #[pyclass]
 pub struct PyReportEngine {
     engine: ReportEngine,
+    /// Behind a mutex so the render methods can take &self
+    cache: Mutex<ReportCache>,
+}
+
+impl ReportCache {
+    /// Render a report for scan data with the given typed_scan_data_hash
+    /// 
+    /// Reuses the cached output when the key matches the cached one; a
+    /// None key (dict input) is rendered without touching the cache.
+    fn render(&mut self, key: Option<u64>, format: &str, output_format: ReportFormat) -> Arc<str> {
+        let key = match key {
+            Some(key) => key,
+            None => return render_report(format, output_format).into(),
+        };
+
+        if self.key != Some(key) {
+            self.reports.clear();
+            self.key = Some(key);
+        }
+        let report = self.reports
+            .entry(output_format)
+            .or_insert_with(|| render_report(format, output_format).into());
+        Arc::clone(report)
+    }
+}
+
+impl PyReportEngine {
+    fn lock_cache(&self) -> MutexGuard<'_, ReportCache> {
+        self.cache.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Render a single report, reusing the cached output for unchanged typed data
+    fn render(&self, scan_data: &PyAny, format: &str, output_format: ReportFormat) -> PyResult<Arc<str>> {
+        let key = typed_scan_data_hash(scan_data)?;
+        Ok(self.lock_cache().render(key, format, output_format))
+    }
 }
 
 #[pymethods]
@@ -25,13 +142,20 @@ impl PyReportEngine {
     #[new]
     fn new() -> PyResult<Self> {
         let engine = ReportEngine::new();
-        Ok(PyReportEngine { engine })
+        Ok(PyReportEngine {
+            engine,
+            cache: Mutex::new(ReportCache::default()),
+        })
     }
 
     /// Generate report in specified format
     /// 
+    /// Reports for a ScanResult or ScanInput are cached per format, so
+    /// asking for the same format again with unchanged data is free.
+    /// Dicts are rendered on every call.
+    /// 
     /// Args:
-    ///     scan_data (dict): Scan results data
+    ///     scan_data (dict | ScanResult | ScanInput): Scan results data
     ///     format (str): Output format ("json", "yaml", "html", "table")
     ///     output_path (str, optional): File path to save report
     /// 
@@ -41,34 +165,126 @@ impl PyReportEngine {
     /// Example:
     ///     >>> report = engine.generate_report(scan_data, "json")
     ///     >>> print(report)
-    #[pyo3(signature = (_scan_data, format, output_path=None))]
+    #[pyo3(signature = (scan_data, format, output_path=None))]
     fn generate_report(
         &self,
-        _scan_data: &PyDict,
+        scan_data: &PyAny,
         format: String,
         output_path: Option<String>,
     ) -> PyResult<String> {
-        let _output_format = match format.as_str() {
-            "json" => ReportFormat::Json,
-            "json_pretty" => ReportFormat::JsonPretty,
-            "yaml" => ReportFormat::Yaml,
-            "html" => ReportFormat::Html,
-            "table" => ReportFormat::Table,
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                format!("Invalid format: {}. Use: json, yaml, html, or table", format)
-            )),
-        };
+        let output_format = parse_format(&format)?;
+        let report = self.render(scan_data, &format, output_format)?;
+
+        if let Some(path) = output_path {
+            write_report(&path, &report)?;
+        }
+
+        Ok(report.to_string())
+    }
 
-        // In a real implementation, would convert scan_data to ScanReport
-        // For now, return a simple formatted string
-        let report = format!("Report generated in {} format", format);
+    /// Generate report in specified format as UTF-8 bytes
+    /// 
+    /// Same as generate_report, but the cached report is copied straight
+    /// into a bytes object instead of being decoded into a str. Prefer it
+    /// for large reports that are only written out or sent over the wire.
+    /// 
+    /// Args:
+    ///     scan_data (dict | ScanResult | ScanInput): Scan results data
+    ///     format (str): Output format ("json", "yaml", "html", "table")
+    ///     output_path (str, optional): File path to save report
+    /// 
+    /// Returns:
+    ///     bytes: Generated report, UTF-8 encoded
+    /// 
+    /// Example:
+    ///     >>> report = engine.generate_report_bytes(scan_data, "html")
+    ///     >>> sock.sendall(report)
+    #[pyo3(signature = (scan_data, format, output_path=None))]
+    fn generate_report_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        scan_data: &PyAny,
+        format: String,
+        output_path: Option<String>,
+    ) -> PyResult<&'py PyBytes> {
+        let output_format = parse_format(&format)?;
+        let report = self.render(scan_data, &format, output_format)?;
 
         if let Some(path) = output_path {
-            std::fs::write(&path, &report)
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to write report: {}", e)))?;
+            write_report(&path, &report)?;
         }
 
-        Ok(report)
+        Ok(PyBytes::new(py, report.as_bytes()))
+    }
+
+    /// Generate several reports from the same scan data in one call
+    /// 
+    /// The scan data crosses into Rust and is hashed once, then rendered
+    /// by each requested format in turn.
+    /// 
+    /// Args:
+    ///     scan_data (dict | ScanResult | ScanInput): Scan results data
+    ///     specs (list[tuple[str, str | None]]): (format, output_path) pairs;
+    ///         a None path returns the report without saving it
+    /// 
+    /// Returns:
+    ///     dict[str, str]: Generated reports keyed by format
+    /// 
+    /// Example:
+    ///     >>> reports = engine.generate_multi(scan_data, [("json", "r.json"), ("table", None)])
+    ///     >>> print(reports["table"])
+    fn generate_multi(
+        &self,
+        scan_data: &PyAny,
+        specs: Vec<(String, Option<String>)>,
+    ) -> PyResult<HashMap<String, String>> {
+        // Validate every format before rendering or writing anything
+        let formats = specs.iter()
+            .map(|(format, _)| parse_format(format))
+            .collect::<PyResult<Vec<_>>>()?;
+
+        // Hash the scan data and take the cache lock once for all formats
+        let key = typed_scan_data_hash(scan_data)?;
+        let rendered: Vec<Arc<str>> = {
+            let mut cache = self.lock_cache();
+            specs.iter()
+                .zip(formats)
+                .map(|((format, _), output_format)| cache.render(key, format, output_format))
+                .collect()
+        };
+
+        let mut reports = HashMap::with_capacity(specs.len());
+        for ((format, output_path), report) in specs.into_iter().zip(rendered) {
+            if let Some(path) = output_path {
+                write_report(&path, &report)?;
+            }
+            reports.insert(format, report.to_string());
+        }
+
+        Ok(reports)
+    }
+
+    /// Generate reports in several formats without saving them
+    /// 
+    /// Shorthand for generate_multi with no output paths.
+    /// 
+    /// Args:
+    ///     scan_data (dict | ScanResult | ScanInput): Scan results data
+    ///     formats (list[str]): Output formats
+    /// 
+    /// Returns:
+    ///     dict[str, str]: Generated reports keyed by format
+    /// 
+    /// Example:
+    ///     >>> reports = engine.generate_reports(scan_data, ["json", "yaml"])
+    ///     >>> print(reports["yaml"])
+    fn generate_reports(
+        &self,
+        scan_data: &PyAny,
+        formats: Vec<String>,
+    ) -> PyResult<HashMap<String, String>> {
+        let specs = formats.into_iter().map(|format| (format, None)).collect();
+        self.generate_multi(scan_data, specs)
     }
 
     /// Create a report builder for customization
@@ -84,6 +300,59 @@ impl PyReportEngine {
     }
 }
 
+/// Typed port result for report input
+#[pyclass(frozen, get_all)]
+#[derive(Clone, Hash)]
+pub struct PyPortResult {
+    port: u16,
+    open: bool,
+}
+
+#[pymethods]
+impl PyPortResult {
+    #[new]
+    fn new(port: u16, open: bool) -> Self {
+        PyPortResult { port, open }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("PortResult(port={}, open={})", self.port, self.open)
+    }
+}
+
+/// Typed, immutable scan data for report generation
+/// 
+/// Reports built from a ScanInput skip the dict traversal and string-key
+/// lookups that a plain dict requires on every call.
+/// 
+/// Example:
+///     >>> from nrmap import PortResult, ScanInput
+///     >>> scan_input = ScanInput("192.168.1.1", [PortResult(22, True)])
+///     >>> report = engine.generate_report(scan_input, "json")
+#[pyclass(frozen, get_all)]
+#[derive(Clone, Hash)]
+pub struct PyScanInput {
+    target: String,
+    tcp_results: Vec<PyPortResult>,
+}
+
+#[pymethods]
+impl PyScanInput {
+    #[new]
+    #[pyo3(signature = (target, tcp_results=Vec::new()))]
+    fn new(target: String, tcp_results: Vec<PyPortResult>) -> Self {
+        PyScanInput { target, tcp_results }
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "ScanInput(target={}, tcp_results={})",
+            self.target,
+            self.tcp_results.len()
+        )
+    }
+}
+
 /// Python wrapper for Report Format
 #[pyclass]
 #[derive(Clone)]
@@ -94,9 +363,15 @@ pub struct PyReportFormat {
 
 #[pymethods]
 impl PyReportFormat {
+    /// Create a report format by name
+    /// 
+    /// Args:
+    ///     name (str): Format name, one of available_formats();
+    ///         anything else raises ValueError
     #[new]
-    fn new(name: String) -> Self {
-        PyReportFormat { name }
+    fn new(name: String) -> PyResult<Self> {
+        parse_format(&name)?;
+        Ok(PyReportFormat { name })
     }
 
     /// Get available formats
@@ -104,14 +379,10 @@ impl PyReportFormat {
     /// Returns:
     ///     list[str]: List of supported formats
     #[staticmethod]
-    fn available_formats() -> Vec<String> {
-        vec![
-            "json".to_string(),
-            "json_pretty".to_string(),
-            "yaml".to_string(),
-            "html".to_string(),
-            "table".to_string(),
-        ]
+    fn available_formats(py: Python<'_>) -> &PyList {
+        let formats = AVAILABLE_FORMATS.get_or_init(py, || PyList::new(py, FORMAT_NAMES).into());
+        // Hand out a shallow copy so callers can't mutate the cached list
+        formats.as_ref(py).get_slice(0, FORMAT_NAMES.len())
     }
 
     fn __repr__(&self) -> String {
@@ -20,7 +20,7 @@ use std::net::IpAddr;
 use tracing::info;
 
 /// Report format enumeration
-#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
 pub enum ReportFormat {
     Json,
     JsonPretty,
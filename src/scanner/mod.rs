@@ -8,6 +8,8 @@ pub mod tcp_connect;
 pub mod tcp_syn;
 pub mod udp_scan;
 pub mod throttle;
+#[cfg(all(target_os = "linux", feature = "uring"))]
+pub mod uring_connect;
 
 use crate::config::ScannerConfig;
 use host_discovery::{HostDiscovery, HostStatus};
@@ -20,6 +22,9 @@ use std::sync::Arc;
 use tracing::{info, warn};
 use serde::{Deserialize, Serialize};
 
+/// Maximum number of targets scanned concurrently by multi-target scans
+pub const MAX_CONCURRENT_TARGETS: usize = 10;
+
 /// Scan type selection
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum ScanType {
@@ -221,7 +226,7 @@ impl Scanner {
                     }
                 }
             })
-            .buffer_unordered(10) // Limit concurrent target scans
+            .buffer_unordered(MAX_CONCURRENT_TARGETS)
             .collect::<Vec<_>>()
             .await;
 
@@ -232,6 +237,11 @@ impl Scanner {
         Ok(results)
     }
 
+    /// Get the scanner configuration
+    pub fn config(&self) -> &ScannerConfig {
+        &self.config
+    }
+
     /// Get current throttle statistics (if throttling is enabled)
     pub async fn get_throttle_stats(&self) -> Option<ThrottleStats> {
         if let Some(ref throttle) = self.throttle {
@@ -0,0 +1,311 @@
+/// io_uring batched TCP connect for NrMAP (Linux only)
+///
+/// Submits one IORING_OP_CONNECT per port, each linked to a timeout, and
+/// keeps a window of them in flight: every io_uring_enter() submits the
+/// connects that refill the window and reaps the completions that freed
+/// it. Compared with one tokio connect future per port this avoids the
+/// per-socket epoll registration and wakeup. Callers must fall back to the
+/// regular TCP connect scanner when `is_supported()` returns false
+/// (kernels older than 5.6, or io_uring disabled by seccomp/sysctl).
+
+use crate::config::TcpConnectConfig;
+use crate::error::{ScanError, ScanResult};
+use io_uring::{opcode, squeue, types, IoUring, Probe};
+use lazy_static::lazy_static;
+use socket2::{Domain, Protocol, SockAddr, Socket, Type};
+use std::collections::HashSet;
+use std::io::ErrorKind;
+use std::net::{IpAddr, SocketAddr};
+use std::os::unix::io::AsRawFd;
+use std::time::Duration;
+use tracing::debug;
+
+/// Most connects kept in flight per ring: a ring holds at most 32768
+/// entries and each port takes a connect and a timeout entry
+const MAX_IN_FLIGHT: usize = 16384;
+
+/// user_data tag for link-timeout completions
+const TIMEOUT_USER_DATA: u64 = u64::MAX;
+
+lazy_static! {
+    static ref CONNECT_SUPPORTED: bool = probe_connect();
+}
+
+/// Outcome of a single connect attempt
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum ConnectOutcome {
+    /// Handshake completed
+    Open,
+    /// Connection refused
+    Closed,
+    /// Timed out waiting for the handshake
+    Filtered,
+    /// Failed for another reason; worth retrying
+    Failed,
+}
+
+impl ConnectOutcome {
+    /// Classify a connect CQE result (0 or a negated errno)
+    fn from_result(result: i32) -> Self {
+        match -result {
+            // A connect retried by io-wq after the handshake already
+            // completed reports EISCONN instead of 0
+            0 | libc::EISCONN => ConnectOutcome::Open,
+            libc::ECONNREFUSED => ConnectOutcome::Closed,
+            // Cancelled (or interrupted in io-wq) by the linked timeout
+            libc::ECANCELED | libc::EINTR | libc::ETIMEDOUT => ConnectOutcome::Filtered,
+            _ => ConnectOutcome::Failed,
+        }
+    }
+}
+
+fn probe_connect() -> bool {
+    let ring = match IoUring::new(2) {
+        Ok(ring) => ring,
+        Err(e) => {
+            debug!("io_uring unavailable: {}", e);
+            return false;
+        }
+    };
+
+    let mut probe = Probe::new();
+    ring.submitter().register_probe(&mut probe).is_ok() && probe.is_supported(opcode::Connect::CODE)
+}
+
+/// Whether the running kernel can do io_uring connects (probed once)
+pub fn is_supported() -> bool {
+    *CONNECT_SUPPORTED
+}
+
+fn build_ring(entries: u32) -> std::io::Result<IoUring> {
+    // SINGLE_ISSUER/DEFER_TASKRUN need Linux 6.1; retry without them
+    IoUring::builder()
+        .setup_single_issuer()
+        .setup_defer_taskrun()
+        .build(entries)
+        .or_else(|_| IoUring::new(entries))
+}
+
+/// Connect to each port of `target` and return the ports that accepted
+///
+/// Follows the same settings as TcpConnectScanner: up to `max_in_flight`
+/// connects are kept outstanding, a new one starting as each completes,
+/// each bounded by `config.timeout_ms`; ports whose connect failed for a
+/// reason other than refused or timed out are retried up to
+/// `config.retries` times, `retry_delay_ms` apart. Blocks the calling
+/// thread, so async callers should run it via
+/// `tokio::task::spawn_blocking`. Open ports are returned in input order.
+pub fn connect_batch(
+    target: IpAddr,
+    ports: &[u16],
+    config: &TcpConnectConfig,
+    max_in_flight: usize,
+) -> ScanResult<Vec<u16>> {
+    if !config.enabled {
+        return Err(ScanError::scanner_error("TCP connect scan is disabled"));
+    }
+
+    let timeout = Duration::from_millis(config.timeout_ms);
+    let mut open = HashSet::new();
+    let mut pending = ports.to_vec();
+
+    for attempt in 0..=config.retries {
+        if pending.is_empty() {
+            break;
+        }
+        if attempt > 0 {
+            std::thread::sleep(Duration::from_millis(config.retry_delay_ms));
+            debug!("Retrying {} ports on {} (attempt {})", pending.len(), target, attempt + 1);
+        }
+
+        let outcomes = connect_window(target, &pending, timeout, max_in_flight)?;
+        let mut failed = Vec::new();
+        for (&port, outcome) in pending.iter().zip(outcomes) {
+            match outcome {
+                ConnectOutcome::Open => {
+                    open.insert(port);
+                }
+                ConnectOutcome::Failed => failed.push(port),
+                ConnectOutcome::Closed | ConnectOutcome::Filtered => {}
+            }
+        }
+        pending = failed;
+    }
+
+    let open_ports: Vec<u16> = ports.iter().copied().filter(|port| open.contains(port)).collect();
+    debug!("io_uring connect batch: {}/{} ports open on {}", open_ports.len(), ports.len(), target);
+    Ok(open_ports)
+}
+
+/// A connect occupying one slot of the in-flight window
+struct InFlight {
+    /// Index of the port in the scanned slice
+    index: usize,
+    /// Kept alive until the connect completes; dropping it closes the fd
+    _socket: Socket,
+    /// Read by the kernel until the connect completes
+    _addr: Box<SockAddr>,
+}
+
+/// Connect to every port through one ring with a sliding window
+///
+/// Keeps up to `max_in_flight` connect+timeout pairs queued and starts
+/// the next port whenever a connect completes. Returns one outcome per
+/// port, in input order.
+fn connect_window(
+    target: IpAddr,
+    ports: &[u16],
+    timeout: Duration,
+    max_in_flight: usize,
+) -> ScanResult<Vec<ConnectOutcome>> {
+    if ports.is_empty() {
+        return Ok(Vec::new());
+    }
+
+    let window = max_in_flight.clamp(1, MAX_IN_FLIGHT).min(ports.len());
+    let mut ring = build_ring((window * 2).next_power_of_two() as u32)?;
+
+    let domain = Domain::for_address(SocketAddr::new(target, 0));
+    let timespec = types::Timespec::new()
+        .sec(timeout.as_secs())
+        .nsec(timeout.subsec_nanos());
+
+    let mut slots: Vec<Option<InFlight>> = (0..window).map(|_| None).collect();
+    let mut free_slots: Vec<usize> = (0..window).rev().collect();
+    let mut outcomes = vec![ConnectOutcome::Failed; ports.len()];
+    let mut next = 0;
+    // Completions still owed by the kernel (a connect and a timeout per port)
+    let mut pending = 0;
+
+    loop {
+        // Refill the window
+        while next < ports.len() {
+            let slot = match free_slots.pop() {
+                Some(slot) => slot,
+                None => break,
+            };
+
+            // Sockets stay blocking: io_uring hands the connect to an io-wq
+            // worker, which waits for the handshake on every kernel with the
+            // opcode. A non-blocking socket would complete with -EINPROGRESS
+            // on kernels whose io_uring does not poll for connect completion.
+            let socket = Socket::new(domain, Type::STREAM, Some(Protocol::TCP))?;
+            let addr = Box::new(SockAddr::from(SocketAddr::new(target, ports[next])));
+
+            let connect = opcode::Connect::new(types::Fd(socket.as_raw_fd()), addr.as_ptr(), addr.len())
+                .build()
+                .flags(squeue::Flags::IO_LINK)
+                .user_data(slot as u64);
+            let link_timeout = opcode::LinkTimeout::new(&timespec)
+                .build()
+                .user_data(TIMEOUT_USER_DATA);
+
+            // SAFETY: the socket and address live in the slot until the
+            // connect completes, and timespec outlives the whole loop. The
+            // submission queue holds 2 * window entries and at most
+            // window pairs are ever queued.
+            unsafe {
+                let mut submission = ring.submission();
+                submission.push(&connect)
+                    .map_err(|_| ScanError::scanner_error("io_uring submission queue full"))?;
+                submission.push(&link_timeout)
+                    .map_err(|_| ScanError::scanner_error("io_uring submission queue full"))?;
+            }
+
+            slots[slot] = Some(InFlight { index: next, _socket: socket, _addr: addr });
+            next += 1;
+            pending += 2;
+        }
+
+        if pending == 0 {
+            break;
+        }
+
+        match ring.submit_and_wait(1) {
+            Ok(_) => {}
+            Err(e) if e.kind() == ErrorKind::Interrupted => continue,
+            Err(e) => return Err(e.into()),
+        }
+
+        for cqe in ring.completion() {
+            pending -= 1;
+            let user_data = cqe.user_data();
+            if user_data == TIMEOUT_USER_DATA {
+                continue;
+            }
+
+            let slot = user_data as usize;
+            if let Some(in_flight) = slots[slot].take() {
+                outcomes[in_flight.index] = ConnectOutcome::from_result(cqe.result());
+            }
+            free_slots.push(slot);
+        }
+    }
+
+    Ok(outcomes)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::net::{Ipv4Addr, TcpListener};
+
+    fn create_test_config() -> TcpConnectConfig {
+        TcpConnectConfig {
+            enabled: true,
+            timeout_ms: 2000,
+            retries: 1,
+            retry_delay_ms: 100,
+        }
+    }
+
+    /// A bound but non-listening socket, so connects to it are refused
+    fn refusing_port() -> (Socket, u16) {
+        let socket = Socket::new(Domain::IPV4, Type::STREAM, Some(Protocol::TCP)).unwrap();
+        socket.bind(&SocketAddr::from((Ipv4Addr::LOCALHOST, 0)).into()).unwrap();
+        let port = socket.local_addr().unwrap().as_socket().unwrap().port();
+        (socket, port)
+    }
+
+    #[test]
+    fn test_connect_outcome_from_result() {
+        assert_eq!(ConnectOutcome::from_result(0), ConnectOutcome::Open);
+        assert_eq!(ConnectOutcome::from_result(-libc::EISCONN), ConnectOutcome::Open);
+        assert_eq!(ConnectOutcome::from_result(-libc::ECONNREFUSED), ConnectOutcome::Closed);
+        assert_eq!(ConnectOutcome::from_result(-libc::ECANCELED), ConnectOutcome::Filtered);
+        assert_eq!(ConnectOutcome::from_result(-libc::EINTR), ConnectOutcome::Filtered);
+        assert_eq!(ConnectOutcome::from_result(-libc::ETIMEDOUT), ConnectOutcome::Filtered);
+        assert_eq!(ConnectOutcome::from_result(-libc::ENETUNREACH), ConnectOutcome::Failed);
+        assert_eq!(ConnectOutcome::from_result(-libc::EMFILE), ConnectOutcome::Failed);
+    }
+
+    #[test]
+    fn test_connect_batch_disabled() {
+        let mut config = create_test_config();
+        config.enabled = false;
+
+        let target = IpAddr::V4(Ipv4Addr::LOCALHOST);
+        assert!(connect_batch(target, &[80], &config, 10).is_err());
+    }
+
+    #[test]
+    fn test_connect_batch_local_ports() {
+        if !is_supported() {
+            eprintln!("io_uring connect unsupported here, skipping");
+            return;
+        }
+
+        let listener = TcpListener::bind((Ipv4Addr::LOCALHOST, 0)).unwrap();
+        let open_port = listener.local_addr().unwrap().port();
+        let (_refusing, closed_port) = refusing_port();
+        let config = create_test_config();
+        let target = IpAddr::V4(Ipv4Addr::LOCALHOST);
+        let ports = [closed_port, open_port, closed_port, open_port];
+
+        // A full window and a window of one (every port waits for a slot)
+        for max_in_flight in [ports.len(), 1] {
+            let open_ports = connect_batch(target, &ports, &config, max_in_flight).unwrap();
+            assert_eq!(open_ports, vec![open_port, open_port]);
+        }
+    }
+}